@@ -0,0 +1,70 @@
+"""
+HTTP helpers shared by the PipeIQ clients.
+"""
+
+import asyncio
+import json
+import math
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+# Parses JSON response bodies, with orjson when it is installed
+json_loads = orjson.loads if orjson is not None else json.loads
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        # "inf" and "nan" parse as floats but are no usable delay
+        return max(0.0, seconds) if math.isfinite(seconds) else None
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+def backoff_delay(
+    attempt: int,
+    base_backoff: float,
+    max_backoff: float,
+    retry_after: Optional[float] = None,
+) -> float:
+    """
+    Seconds to wait before retry number attempt + 1, at most max_backoff.
+
+    A server-advised retry_after is used when given; otherwise the delay is
+    an exponential backoff with full jitter, which keeps concurrent clients
+    from retrying in lockstep.
+    """
+    if retry_after is not None:
+        return min(retry_after, max_backoff)
+    return random.uniform(0, min(max_backoff, base_backoff * 2 ** attempt))
+
+
+async def retry_sleep(delay: float) -> None:
+    """
+    Wait out a backoff delay before retrying a request.
+
+    Clients call this through the module, so tests can replace it here
+    instead of patching asyncio.sleep, which the event loop also uses.
+    """
+    await asyncio.sleep(delay)
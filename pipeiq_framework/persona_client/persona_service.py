@@ -5,16 +5,23 @@ This module provides a service for interacting with Persona's identity verificat
 """
 
 from enum import Enum
-from typing import Dict, List, Optional, Union, Any, Callable
+from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass, field
 import json
 import aiohttp
-from datetime import datetime, timedelta
+from datetime import datetime
 import asyncio
 from functools import wraps
 import time
 import hashlib
 
+from pipeiq_framework._http import json_loads
+
+
+# Replaced by the tests, like pipeiq_framework._http.retry_sleep
+_clock = time.time
+_sleep = asyncio.sleep
+
 class InquiryStatus(str, Enum):
     """Status of a Persona inquiry."""
     CREATED = "created"
@@ -192,13 +199,13 @@ class RateLimiter:
     def __init__(self, config: RateLimitConfig):
         self.config = config
         self.tokens = config.burst_size
-        self.last_update = time.time()
+        self.last_update = _clock()
         self.lock = asyncio.Lock()
     
     async def acquire(self) -> None:
         """Acquire a token from the rate limiter."""
         async with self.lock:
-            now = time.time()
+            now = _clock()
             time_passed = now - self.last_update
             self.tokens = min(
                 self.config.burst_size,
@@ -207,7 +214,7 @@ class RateLimiter:
             
             if self.tokens < 1:
                 wait_time = (1 - self.tokens) / self.config.requests_per_second
-                await asyncio.sleep(wait_time)
+                await _sleep(wait_time)
                 self.tokens = 1
             
             self.tokens -= 1
@@ -235,7 +242,7 @@ class Cache:
         async with self.lock:
             if key in self.cache:
                 item = self.cache[key]
-                if time.time() < item["expires_at"]:
+                if _clock() < item["expires_at"]:
                     return item["value"]
                 del self.cache[key]
         return None
@@ -246,17 +253,15 @@ class Cache:
             return
             
         async with self.lock:
+            # Every entry shares the same TTL, so insertion order is expiry
+            # order: re-inserting keeps that true and the first key is the oldest
+            self.cache.pop(key, None)
             if len(self.cache) >= self.config.max_size:
-                # Remove oldest item
-                oldest_key = min(
-                    self.cache.keys(),
-                    key=lambda k: self.cache[k]["expires_at"]
-                )
-                del self.cache[oldest_key]
+                del self.cache[next(iter(self.cache))]
             
             self.cache[key] = {
                 "value": value,
-                "expires_at": time.time() + self.config.ttl
+                "expires_at": _clock() + self.config.ttl
             }
 
 def with_retry(config: RetryConfig):
@@ -279,12 +284,12 @@ def with_retry(config: RetryConfig):
                         if e.status not in config.retry_on_status_codes:
                             raise
                     
+                    await _sleep(delay)
+                    
                     if config.strategy == RetryStrategy.EXPONENTIAL_BACKOFF:
                         delay = min(delay * 2, config.max_delay)
                     elif config.strategy == RetryStrategy.LINEAR_BACKOFF:
                         delay = min(delay + config.initial_delay, config.max_delay)
-                    
-                    await asyncio.sleep(delay)
             
             raise last_exception
         return wrapper
@@ -407,7 +412,7 @@ class PersonaService:
                         raise PersonaError(f"API error: {error_text}")
                     else:
                         raise PersonaError(f"API error: {error_text}")
-                return await response.json()
+                return await response.json(loads=json_loads)
         except aiohttp.ClientError as e:
             raise ConnectionError(f"Network error: {str(e)}")
         except json.JSONDecodeError as e:
@@ -430,15 +435,13 @@ class PersonaService:
                     raise
                 
                 if attempt < self.retry_config.max_retries:
+                    await _sleep(delay)
+                    
                     # Calculate next delay based on strategy
                     if self.retry_config.strategy == RetryStrategy.EXPONENTIAL_BACKOFF:
                         delay = min(delay * 2, self.retry_config.max_delay)
                     elif self.retry_config.strategy == RetryStrategy.LINEAR_BACKOFF:
                         delay = min(delay + self.retry_config.initial_delay, self.retry_config.max_delay)
-                    elif self.retry_config.strategy == RetryStrategy.CONSTANT:
-                        delay = self.retry_config.initial_delay
-                    
-                    await asyncio.sleep(delay)
                 else:
                     raise last_exception
 
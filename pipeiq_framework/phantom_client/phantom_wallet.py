@@ -3,27 +3,41 @@ Phantom wallet integration for PipeIQ framework.
 """
 
 from enum import Enum
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
-import json
+from collections import OrderedDict
 import aiohttp
 from datetime import datetime
 import os
+import time
 import logging
 from dotenv import load_dotenv
 
+from pipeiq_framework._http import json_loads
+
 # Load environment variables
 load_dotenv()
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Most NFT metadata entries a wallet keeps before evicting the least recently used
+NFT_METADATA_CACHE_SIZE = 1024
+
+
 class NetworkType(str, Enum):
     """Supported blockchain networks."""
     MAINNET = "mainnet"
     TESTNET = "testnet"
     DEVNET = "devnet"
 
+# Solana RPC endpoint for each network
+RPC_ENDPOINTS = {
+    NetworkType.MAINNET: "https://api.mainnet-beta.solana.com",
+    NetworkType.TESTNET: "https://api.testnet.solana.com",
+    NetworkType.DEVNET: "https://api.devnet.solana.com"
+}
+
 class TransactionStatus(str, Enum):
     """Transaction status types."""
     PENDING = "pending"
@@ -136,6 +150,7 @@ class PhantomWallet:
         self._session: Optional[aiohttp.ClientSession] = None
         self._public_key = public_key  # Accept public key directly
         self._initial_public_key = public_key  # Track if key was provided during init
+        self._nft_metadata_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
         logger.info(f"🔧 PhantomWallet initialized with network: {self.config.network.value}")
     
     async def connect(self) -> Dict[str, Any]:
@@ -197,13 +212,7 @@ class PhantomWallet:
         
         try:
             # Determine RPC endpoint based on network
-            rpc_endpoints = {
-                NetworkType.MAINNET: "https://api.mainnet-beta.solana.com",
-                NetworkType.TESTNET: "https://api.testnet.solana.com", 
-                NetworkType.DEVNET: "https://api.devnet.solana.com"
-            }
-            
-            rpc_url = rpc_endpoints.get(self.config.network, rpc_endpoints[NetworkType.MAINNET])
+            rpc_url = RPC_ENDPOINTS.get(self.config.network, RPC_ENDPOINTS[NetworkType.MAINNET])
             logger.info(f"🌐 Using Solana RPC endpoint: {rpc_url}")
             
             # Prepare RPC request
@@ -217,7 +226,7 @@ class PhantomWallet:
             # Make RPC call
             async with self._session.post(rpc_url, json=payload) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = await response.json(loads=json_loads)
                     if "result" in data and "value" in data["result"]:
                         # Convert lamports to SOL (1 SOL = 1,000,000,000 lamports)
                         lamports = data["result"]["value"]
@@ -359,12 +368,32 @@ class PhantomWallet:
         mint_address: str,
         config: Optional[NFTConfig] = None
     ) -> Dict[str, Any]:
-        """Get NFT metadata."""
+        """
+        Get NFT metadata.
+        
+        Metadata is cached per network, mint and NFT standard, keeping the
+        NFT_METADATA_CACHE_SIZE most recently used entries. Every caller
+        gets the same cached dict, so treat it as read-only.
+        """
         if not self._connected:
             raise PhantomConnectionError("Wallet not connected")
         
         config = config or NFTConfig()
-        
+        key = (self.config.network, mint_address, config.standard)
+        
+        cached = self._nft_metadata_cache.get(key)
+        if cached is not None:
+            self._nft_metadata_cache.move_to_end(key)
+            return cached
+        
+        metadata = self._fetch_nft_metadata(mint_address, config)
+        self._nft_metadata_cache[key] = metadata
+        if len(self._nft_metadata_cache) > NFT_METADATA_CACHE_SIZE:
+            self._nft_metadata_cache.popitem(last=False)
+        return metadata
+    
+    def _fetch_nft_metadata(self, mint_address: str, config: NFTConfig) -> Dict[str, Any]:
+        """Fetch the metadata of an NFT."""
         return {
             "name": "Test NFT",
             "symbol": "TNFT",
@@ -480,7 +509,7 @@ class PhantomWallet:
                 "rewards": 1.5,
                 "lockup": {
                     "epoch": 100,
-                    "unixTimestamp": int(datetime.now().timestamp())
+                    "unixTimestamp": int(time.time())
                 }
             }
         ]
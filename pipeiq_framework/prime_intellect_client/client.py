@@ -4,13 +4,18 @@ Prime Intellect API Client
 
 import aiohttp
 import asyncio
-from typing import Dict, List, Optional, Any
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Any, NamedTuple, Tuple
 from urllib.parse import urlencode
 import logging
+from enum import Enum
+
+from pipeiq_framework import _http
 
 from .models import GPUAvailability
 from .exceptions import (
-    PrimeIntellectError,
     APIError,
     ValidationError,
     NetworkError,
@@ -21,6 +26,51 @@ from .exceptions import (
 logger = logging.getLogger(__name__)
 
 
+def _param_str(value: Any) -> str:
+    """Render a query parameter, using an enum member's value rather than its name."""
+    return str(value.value if isinstance(value, Enum) else value)
+
+
+def _clean_params(params: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+    """Drop None values and render the rest as query strings, lists as tuples of them."""
+    return tuple(
+        (key, tuple(_param_str(item) for item in value if item is not None)
+         if isinstance(value, (list, tuple)) else _param_str(value))
+        for key, value in params.items()
+        if value is not None
+    )
+
+
+@lru_cache(maxsize=256)
+def _encode_query(items: Tuple[Tuple[str, Any], ...]) -> str:
+    """
+    Encode pairs from _clean_params into a query string.
+
+    Memoized so that callers polling with the same filters reuse the
+    encoded string instead of rebuilding it on every request. The pairs
+    are already rendered as strings, so values that compare equal but
+    render differently (1, 1.0 and True) are cached separately.
+    """
+    return urlencode(items, doseq=True)
+
+
+class _CacheEntry(NamedTuple):
+    """A cached, already parsed GET response and the validators to revalidate it with."""
+    expires_at: float
+    etag: Optional[str]
+    last_modified: Optional[str]
+    data: Any
+
+
+def _parse_offers(response_data: Dict[str, List[Dict[str, Any]]]) -> List[GPUAvailability]:
+    """Parse an availability response, a dict of offers keyed by GPU type."""
+    return [
+        GPUAvailability.from_dict(offer_data)
+        for offers in response_data.values()
+        for offer_data in offers
+    ]
+
+
 class PrimeIntellectClient:
     """
     Async client for the Prime Intellect API.
@@ -38,6 +88,14 @@ class PrimeIntellectClient:
         *,
         base_url: str = "https://api.primeintellect.ai",
         timeout: float = 30.0,
+        max_connections: int = 100,
+        max_connections_per_host: int = 0,
+        dns_cache_ttl: int = 300,
+        cache_ttl: float = 0.0,
+        cache_maxsize: int = 128,
+        max_retries: int = 0,
+        base_backoff: float = 0.5,
+        max_backoff: float = 30.0,
     ):
         """
         Initialize the Prime Intellect client.
@@ -46,6 +104,19 @@ class PrimeIntellectClient:
             api_key: Prime Intellect API key
             base_url: Base URL for the API
             timeout: Request timeout in seconds
+            max_connections: Maximum number of open connections in the pool
+            max_connections_per_host: Maximum number of open connections to the API host
+                (0, the default, leaves it bounded only by max_connections)
+            dns_cache_ttl: Seconds to cache DNS lookups for
+            cache_ttl: Seconds to serve cached GET responses without revalidating
+                (0, the default, disables caching). Once stale, responses carrying
+                an ETag or Last-Modified header are revalidated with a conditional GET.
+                Cache hits return the same parsed objects to every caller, so
+                treat them as read-only.
+            cache_maxsize: Maximum number of cached GET responses
+            max_retries: Times to retry a request that failed with 429 or a 5xx status
+            base_backoff: Base delay in seconds for exponential backoff between retries
+            max_backoff: Upper bound in seconds on the delay between retries, Retry-After included
         """
         if not api_key:
             raise ValidationError("API key is required")
@@ -53,6 +124,15 @@ class PrimeIntellectClient:
         self._api_key = api_key
         self._base_url = base_url.rstrip("/")
         self._timeout = aiohttp.ClientTimeout(total=timeout)
+        self._max_connections = max_connections
+        self._max_connections_per_host = max_connections_per_host
+        self._dns_cache_ttl = dns_cache_ttl
+        self._cache_ttl = cache_ttl
+        self._cache_maxsize = cache_maxsize
+        self._cache: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._max_retries = max_retries
+        self._base_backoff = base_backoff
+        self._max_backoff = max_backoff
         self._session: Optional[aiohttp.ClientSession] = None
 
     async def __aenter__(self):
@@ -72,7 +152,13 @@ class PrimeIntellectClient:
                 "Content-Type": "application/json",
                 "User-Agent": "prime-intellect-client/0.1.0",
             }
+            connector = aiohttp.TCPConnector(
+                limit=self._max_connections,
+                limit_per_host=self._max_connections_per_host,
+                ttl_dns_cache=self._dns_cache_ttl,
+            )
             self._session = aiohttp.ClientSession(
+                connector=connector,
                 timeout=self._timeout,
                 headers=headers,
             )
@@ -83,57 +169,146 @@ class PrimeIntellectClient:
             await self._session.close()
             self._session = None
 
+    def clear_cache(self):
+        """Drop all cached GET responses."""
+        self._cache.clear()
+
+    def _get_cached(self, url: str) -> Optional[_CacheEntry]:
+        """Return the cached entry for url, fresh or stale, marking it recently used."""
+        entry = self._cache.get(url)
+        if entry is not None:
+            self._cache.move_to_end(url)
+        return entry
+
+    def _store_cached(
+        self,
+        url: str,
+        data: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        """Cache a response for url, evicting the least recently used entry if full."""
+        self._cache[url] = _CacheEntry(
+            expires_at=time.monotonic() + self._cache_ttl,
+            etag=etag,
+            last_modified=last_modified,
+            data=data,
+        )
+        self._cache.move_to_end(url)
+        while len(self._cache) > self._cache_maxsize:
+            self._cache.popitem(last=False)
+
     async def _make_request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
-        """Make an HTTP request to the API."""
+        parse: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """
+        Make an HTTP request to the API.
+
+        parse, if given, converts the decoded JSON body once, before it is
+        cached, so cache hits return the parsed result without converting it
+        again. An endpoint must always be requested with the same parser.
+        """
         await self._ensure_session()
         
         url = f"{self._base_url}/{endpoint.lstrip('/')}"
         
         # Build query string if params provided
         if params:
-            clean_params = {}
-            for key, value in params.items():
-                if value is not None:
-                    if isinstance(value, list):
-                        for item in value:
-                            if item is not None:
-                                clean_params.setdefault(key, []).append(str(item))
-                    else:
-                        clean_params[key] = str(value)
-            
-            if clean_params:
-                url += "?" + urlencode(clean_params, doseq=True)
+            query = _encode_query(_clean_params(params))
+            if query:
+                url += "?" + query
+
+        cacheable = method == "GET" and self._cache_ttl > 0 and self._cache_maxsize > 0
+        cached = self._get_cached(url) if cacheable else None
+        headers = None
+        if cached is not None:
+            if time.monotonic() < cached.expires_at:
+                return cached.data
+            # Stale: ask the server to confirm it's unchanged instead of resending it
+            headers = {}
+            if cached.etag is not None:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified is not None:
+                headers["If-Modified-Since"] = cached.last_modified
+
+        attempt = 0
+        while True:
+            try:
+                return await self._send_request(method, url, headers, cached, cacheable, parse)
+            except APIError as e:
+                if attempt >= self._max_retries or e.status_code not in _http.RETRY_STATUS_CODES:
+                    raise
+                delay = _http.backoff_delay(attempt, self._base_backoff, self._max_backoff, e.retry_after)
+                logger.debug(
+                    "Retrying %s %s in %.2fs after HTTP %s (attempt %d/%d)",
+                    method, url, delay, e.status_code, attempt + 1, self._max_retries,
+                )
+                await _http.retry_sleep(delay)
+                attempt += 1
 
+    async def _send_request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        cached: Optional[_CacheEntry],
+        cacheable: bool,
+        parse: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """Send a single HTTP request and translate the response."""
         try:
-            logger.debug(f"Making {method} request to {url}")
+            logger.debug("Making %s request to %s", method, url)
             
-            async with self._session.request(method, url) as response:
-                response_text = await response.text()
+            async with self._session.request(method, url, headers=headers) as response:
+                if response.status == 304 and cached is not None:
+                    self._store_cached(
+                        url,
+                        cached.data,
+                        etag=response.headers.get("ETag", cached.etag),
+                        last_modified=response.headers.get("Last-Modified", cached.last_modified),
+                    )
+                    return cached.data
+
+                body = await response.read()
                 
                 if response.status == 200:
                     try:
-                        return await response.json()
-                    except aiohttp.ContentTypeError as e:
+                        data = _http.json_loads(body)
+                    except ValueError as e:
                         raise APIError(f"Invalid JSON response: {e}")
+                    if parse is not None:
+                        data = parse(data)
+                    if cacheable:
+                        self._store_cached(
+                            url,
+                            data,
+                            etag=response.headers.get("ETag"),
+                            last_modified=response.headers.get("Last-Modified"),
+                        )
+                    return data
                         
                 elif response.status == 401:
                     raise AuthenticationError("Invalid API key", status_code=401)
                     
                 elif response.status == 429:
-                    raise RateLimitError("Rate limit exceeded", status_code=429)
+                    raise RateLimitError(
+                        "Rate limit exceeded",
+                        status_code=429,
+                        retry_after=_http.parse_retry_after(response.headers.get("Retry-After")),
+                    )
                     
                 elif response.status == 422:
-                    raise ValidationError(f"Validation error: {response_text}")
+                    raise ValidationError(f"Validation error: {body.decode(errors='replace')}")
                     
                 else:
                     raise APIError(
-                        f"API request failed: {response.status} - {response_text}",
+                        f"API request failed: {response.status} - {body.decode(errors='replace')}",
                         status_code=response.status,
+                        retry_after=_http.parse_retry_after(response.headers.get("Retry-After")),
                     )
 
         except aiohttp.ClientError as e:
@@ -169,29 +344,18 @@ class PrimeIntellectClient:
             APIError: API error response
             NetworkError: Network/connection error
         """
-        params = {}
-        if regions is not None:
-            params["regions"] = regions
-        if gpu_count is not None:
-            params["gpu_count"] = gpu_count
-        if gpu_type is not None:
-            params["gpu_type"] = gpu_type
-        if socket is not None:
-            params["socket"] = socket
-        if security is not None:
-            params["security"] = security
-            
-        response_data = await self._make_request(
-            "GET", "/api/v1/availability/", params=params
+        params = {
+            "regions": regions,
+            "gpu_count": gpu_count,
+            "gpu_type": gpu_type,
+            "socket": socket,
+            "security": security,
+        }
+        offers = await self._make_request(
+            "GET", "/api/v1/availability/", params=params, parse=_parse_offers
         )
-        
-        # Parse the response - it's a dict with GPU types as keys
-        all_offers = []
-        for gpu_type_key, offers in response_data.items():
-            for offer_data in offers:
-                all_offers.append(GPUAvailability.from_dict(offer_data))
-        
-        return all_offers
+        # Copy so callers can't reorder or trim the cached list
+        return list(offers)
 
     async def get_cluster_availability(
         self,
@@ -221,26 +385,15 @@ class PrimeIntellectClient:
             APIError: API error response
             NetworkError: Network/connection error
         """
-        params = {}
-        if regions is not None:
-            params["regions"] = regions
-        if gpu_count is not None:
-            params["gpu_count"] = gpu_count
-        if gpu_type is not None:
-            params["gpu_type"] = gpu_type
-        if socket is not None:
-            params["socket"] = socket
-        if security is not None:
-            params["security"] = security
-            
-        response_data = await self._make_request(
-            "GET", "/api/v1/availability/clusters", params=params
+        params = {
+            "regions": regions,
+            "gpu_count": gpu_count,
+            "gpu_type": gpu_type,
+            "socket": socket,
+            "security": security,
+        }
+        # Same response format as regular availability
+        offers = await self._make_request(
+            "GET", "/api/v1/availability/clusters", params=params, parse=_parse_offers
         )
-        
-        # Parse the response - same format as regular availability
-        all_offers = []
-        for gpu_type_key, offers in response_data.items():
-            for offer_data in offers:
-                all_offers.append(GPUAvailability.from_dict(offer_data))
-        
-        return all_offers 
\ No newline at end of file
+        return list(offers) 
\ No newline at end of file
@@ -13,9 +13,15 @@ class PrimeIntellectError(Exception):
 class APIError(PrimeIntellectError):
     """Exception raised for API errors (non-2xx responses)."""
     
-    def __init__(self, message: str, status_code: Optional[int] = None):
+    def __init__(
+        self,
+        message: str,
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None,
+    ):
         super().__init__(message)
         self.status_code = status_code
+        self.retry_after = retry_after
 
 
 class ValidationError(PrimeIntellectError):
@@ -4,7 +4,7 @@ Data models for the Prime Intellect API responses.
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any
 
 
 class GPUType(str, Enum):
@@ -106,6 +106,21 @@ class Provider(str, Enum):
     DC_WILDEBEEST = "dc_wildebeest"
 
 
+# Value-to-member tables, built once at import so parsing an offer is a dict
+# lookup instead of an Enum call that raises on every unknown value
+_ENUM_MEMBERS = {
+    enum_class: {member.value: member for member in enum_class}
+    for enum_class in (SocketType, SecurityType, StockStatus, Provider)
+}
+
+
+def _safe_enum(enum_class, value):
+    """Convert ``value`` to ``enum_class``, or None if it is missing or unknown."""
+    if value is None:
+        return None
+    return _ENUM_MEMBERS[enum_class].get(value)
+
+
 @dataclass
 class ResourceSpec:
     """Resource specification (disk, vcpu, memory)."""
@@ -178,15 +193,6 @@ class GPUAvailability:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "GPUAvailability":
         """Create GPUAvailability from dictionary."""
-        # Helper function to safely convert to enum
-        def safe_enum(enum_class, value):
-            if value is None:
-                return None
-            try:
-                return enum_class(value)
-            except ValueError:
-                return None  # Unknown value, return None
-        
         prices = None
         if data.get("prices"):
             prices = Pricing.from_dict(data["prices"])
@@ -206,8 +212,8 @@ class GPUAvailability:
         return cls(
             cloud_id=data["cloudId"],
             gpu_type=data.get("gpuType", ""),
-            socket=safe_enum(SocketType, data.get("socket")),
-            provider=safe_enum(Provider, data.get("provider")),
+            socket=_safe_enum(SocketType, data.get("socket")),
+            provider=_safe_enum(Provider, data.get("provider")),
             data_center=data.get("dataCenter"),
             country=data.get("country"),
             gpu_count=data.get("gpuCount"),
@@ -219,8 +225,8 @@ class GPUAvailability:
             interconnect=data.get("interconnect"),
             interconnect_type=data.get("interconnectType"),
             provisioning_time=data.get("provisioningTime"),
-            stock_status=safe_enum(StockStatus, data.get("stockStatus")),
-            security=safe_enum(SecurityType, data.get("security")),
+            stock_status=_safe_enum(StockStatus, data.get("stockStatus")),
+            security=_safe_enum(SecurityType, data.get("security")),
             prices=prices,
             images=data.get("images"),
             is_spot=data.get("isSpot"),
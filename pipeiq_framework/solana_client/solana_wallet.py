@@ -1,13 +1,10 @@
 from typing import Optional, Union, Dict, Any
 from solders.keypair import Keypair
-from solders.pubkey import Pubkey
-from solders.transaction import Transaction
 from solana.rpc.async_api import AsyncClient
 from solana.rpc.commitment import Commitment
 import base58
 import logging
-import asyncio
-from datetime import datetime
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -68,13 +65,13 @@ class SolanaWallet:
             SolanaWalletError: If signing fails
         """
         try:
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             logger.debug(f"Signing message of length {len(message)}")
             
             signature = self.keypair.sign_message(message.encode())
             encoded_signature = base58.b58encode(bytes(signature)).decode()
             
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             logger.debug(f"Message signed in {duration:.2f}s")
             
             return encoded_signature
@@ -94,14 +91,14 @@ class SolanaWallet:
             SolanaWalletError: If balance check fails
         """
         try:
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             logger.debug(f"Fetching balance for {self.public_key}")
             
             response = await self._client.get_balance(self.public_key)
                 
             balance = response.value
             
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             logger.info(f"Balance: {balance} lamports (fetched in {duration:.2f}s)")
             
             return balance
@@ -121,11 +118,11 @@ class SolanaWallet:
             SolanaWalletError: If account info fetch fails
         """
         try:
-            start_time = datetime.now()
+            start_time = time.perf_counter()
             logger.debug(f"Fetching account info for {self.public_key}")
             response = await self._client.get_account_info(self.public_key) 
                 
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             logger.info(f"Account info fetched in {duration:.2f}s")
             
             return response.value
@@ -1,16 +1,18 @@
 # worldcoin_client.py
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, AbstractSet
+import asyncio
 import httpx
 import logging
-from datetime import datetime
-import asyncio
+import time
 import json
-import os
 # from dotenv import load_dotenv
 
+from pipeiq_framework import _http
+
 
 logger = logging.getLogger(__name__)
 
+
 class WorldcoinError(Exception):
     """Base exception for Worldcoin client errors."""
 
@@ -41,18 +43,50 @@ class WorldcoinClient:
         base_url: str = "https://developer.worldcoin.org",
         timeout: float = 10.0,
         user_agent: str = "worldcoin-client/0.1",
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 60.0,
+        jwks_cache_ttl: float = 0.0,
+        jwks_error_ttl: float = 0.0,
+        max_retries: int = 0,
+        base_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ):
         self.app_id = app_id
         self._verify_ep = f"{base_url}/api/v2/verify/{app_id}"
         self._meta_ep   = f"{base_url}/api/v1/precheck/{app_id}"
         self._jwks_ep   = f"{base_url}/api/v1/jwks"
+
+        # The key set rarely changes: keep it for jwks_cache_ttl seconds and
+        # let concurrent callers share one in-flight request
+        self._jwks_cache_ttl = jwks_cache_ttl
+        self._jwks: Optional[Tuple[float, Dict[str, Any]]] = None  # (expires_at, jwks)
+        self._jwks_pending: Optional[asyncio.Task] = None
+        # A network error or 5xx is remembered for jwks_error_ttl seconds so a
+        # flapping backend isn't hit again by every caller in the meantime
+        self._jwks_error_ttl = jwks_error_ttl
+        self._jwks_error: Optional[Tuple[float, WorldcoinJWKSError]] = None  # (expires_at, error)
+
+        # Responses with a retryable status are retried up to max_retries times
+        self._max_retries = max_retries
+        self._base_backoff = base_backoff
+        self._max_backoff = max_backoff
         
+        # One pooled client for every call, so keep-alive connections to the
+        # API are reused instead of paying a TCP + TLS handshake per request
         self._client = httpx.AsyncClient(
             timeout=timeout,
             headers={
                 "Content-Type": "application/json",
                 "User-Agent": user_agent,
             },
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            transport=transport,
         )
         logger.info(f"WorldcoinClient ready for app_id {app_id}")
 
@@ -60,33 +94,101 @@ class WorldcoinClient:
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        """Close the underlying HTTP client and its pooled connections."""
         await self._client.aclose()
 
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        retry_statuses: AbstractSet[int] = _http.RETRY_STATUS_CODES,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Send a request, retrying responses with a status in ``retry_statuses``.
+
+        Retries wait for the server's Retry-After when given, otherwise for an
+        exponential backoff with full jitter. The last response is returned
+        whatever its status; network errors are raised to the caller.
+        """
+        attempt = 0
+        while True:
+            r = await self._client.request(method, url, **kwargs)
+            if attempt >= self._max_retries or r.status_code not in retry_statuses:
+                return r
+            delay = _http.backoff_delay(
+                attempt, self._base_backoff, self._max_backoff,
+                _http.parse_retry_after(r.headers.get("Retry-After")),
+            )
+            logger.debug(
+                "Retrying %s %s in %.2fs after HTTP %s (attempt %d/%d)",
+                method, url, delay, r.status_code, attempt + 1, self._max_retries,
+            )
+            await _http.retry_sleep(delay)
+            attempt += 1
+
     async def get_jwks(self) -> Dict[str, Any]:
         """
         Get the JWKS (JSON Web Key Set) from the World ID API.
 
+        Concurrent calls share a single request. With ``jwks_cache_ttl`` set,
+        the key set is served from memory until it expires. With
+        ``jwks_error_ttl`` set, a network error or 5xx response is raised
+        again without a new request until it expires.
+
         Returns:
             Dictionary containing the JWKS
 
         Raises:
             WorldcoinJWKSError: If the request fails
         """
-        start = datetime.now()
+        if self._jwks is not None and time.monotonic() < self._jwks[0]:
+            return self._jwks[1]
+        if self._jwks_error is not None and time.monotonic() < self._jwks_error[0]:
+            raise self._jwks_error[1].with_traceback(None)
+
+        task = self._jwks_pending
+        if task is None:
+            task = asyncio.ensure_future(self._load_jwks())
+            self._jwks_pending = task
+        # Shield the shared fetch so one cancelled caller doesn't cancel it for the others
+        return await asyncio.shield(task)
+
+    async def _load_jwks(self) -> Dict[str, Any]:
+        """Fetch the JWKS and store it in the JWKS cache."""
         try:
-            r = await self._client.get(self._jwks_ep)
-        except Exception as e:
-            raise WorldcoinJWKSError(f"Network error: {e}") from e
-
-        logger.debug("JWKS HTTP %s in %.2fs", r.status_code,
-                     (datetime.now() - start).total_seconds())
-
-        if r.status_code != 200:
-            raise WorldcoinJWKSError(f"HTTP {r.status_code}: {r.text}")
-
-        data = r.json()
-        logger.info("JWKS retrieved")
-        return data
+            start = time.perf_counter()
+            try:
+                r = await self._request("GET", self._jwks_ep)
+            except Exception as e:
+                raise self._remember_jwks_error(WorldcoinJWKSError(f"Network error: {e}")) from e
+
+            logger.debug("JWKS HTTP %s in %.2fs", r.status_code,
+                         time.perf_counter() - start)
+
+            if r.status_code != 200:
+                error = WorldcoinJWKSError(f"HTTP {r.status_code}: {r.text}")
+                if r.status_code >= 500:
+                    self._remember_jwks_error(error)
+                raise error
+
+            data = _http.json_loads(r.content)
+            logger.info("JWKS retrieved")
+            self._jwks_error = None
+            if self._jwks_cache_ttl > 0:
+                self._jwks = (time.monotonic() + self._jwks_cache_ttl, data)
+            return data
+        finally:
+            self._jwks_pending = None
+
+    def _remember_jwks_error(self, error: WorldcoinJWKSError) -> WorldcoinJWKSError:
+        """Store a transient JWKS failure in the negative cache and return it."""
+        if self._jwks_error_ttl > 0:
+            self._jwks_error = (time.monotonic() + self._jwks_error_ttl, error)
+        return error
 
     async def get_action_metadata(self, action: str) -> Dict[str, Any]:
         """
@@ -101,23 +203,23 @@ class WorldcoinClient:
         Raises:
             WorldcoinMetadataError: If the request fails
         """
-        start = datetime.now()
+        start = time.perf_counter()
         payload = {"action": action}
         
         logger.debug("POST /precheck payload: %s", json.dumps(payload, indent=2))
         
         try:
-            r = await self._client.post(self._meta_ep, json=payload)
+            r = await self._request("POST", self._meta_ep, json=payload)
         except Exception as e:
             raise WorldcoinMetadataError(f"Network error: {e}") from e
 
         logger.debug("Metadata HTTP %s in %.2fs", r.status_code,
-                     (datetime.now() - start).total_seconds())
+                     time.perf_counter() - start)
 
         if r.status_code != 200:
             raise WorldcoinMetadataError(f"HTTP {r.status_code}: {r.text}")
 
-        data = r.json()
+        data = _http.json_loads(r.content)
         logger.info("Action metadata retrieved")
         return data
 
@@ -147,7 +249,7 @@ class WorldcoinClient:
         Raises:
             WorldcoinVerifyError: If the request fails
         """
-        start = datetime.now()
+        start = time.perf_counter()
         payload = {
             "nullifier_hash": nullifier_hash,
             "merkle_root": merkle_root,
@@ -160,16 +262,18 @@ class WorldcoinClient:
         logger.debug("POST /verify payload: %s", json.dumps(payload, indent=2))
 
         try:
-            r = await self._client.post(self._verify_ep, json=payload)
+            # A 5xx may come after the proof was accepted, and a nullifier can only
+            # be used once, so only a rate-limited verification is retried
+            r = await self._request("POST", self._verify_ep, retry_statuses={429}, json=payload)
         except Exception as e:
             raise WorldcoinVerifyError(f"Network error: {e}") from e
 
         logger.debug("Verify HTTP %s in %.2fs", r.status_code,
-                     (datetime.now() - start).total_seconds())
+                     time.perf_counter() - start)
 
         if r.status_code != 200:
             raise WorldcoinVerifyError(f"HTTP {r.status_code}: {r.text}")
 
-        data = r.json()
+        data = _http.json_loads(r.content)
         logger.info("Proof verified")
         return data
@@ -0,0 +1,14 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def backoff_sleep():
+    """Make retry backoff return immediately; yields the mock that records delays."""
+    with patch("pipeiq_framework._http.retry_sleep", autospec=True) as mock_sleep:
+        yield mock_sleep
@@ -0,0 +1,69 @@
+"""
+Unit tests for PhantomWallet's NFT metadata cache.
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from pipeiq_framework.phantom_client.phantom_wallet import (
+    NFTConfig,
+    NFTStandard,
+    PhantomWallet,
+)
+
+MINT = "test_nft_mint"
+
+
+@pytest.fixture
+async def wallet():
+    wallet = PhantomWallet(public_key="test_public_key")
+    await wallet.connect()
+    yield wallet
+    await wallet.disconnect()
+
+
+@pytest.fixture
+def fetch(wallet):
+    """Record metadata fetches while still returning the wallet's metadata."""
+    with patch.object(wallet, "_fetch_nft_metadata", wraps=wallet._fetch_nft_metadata) as mock_fetch:
+        yield mock_fetch
+
+
+async def test_nft_metadata_cache_hit_returns_same_object(wallet, fetch):
+    first = await wallet.get_nft_metadata(MINT)
+    second = await wallet.get_nft_metadata(MINT)
+
+    assert id(first) == id(second)
+    assert fetch.call_count == 1
+    assert first["name"] == "Test NFT"
+    assert json.loads(json.dumps(first)) == first
+
+
+async def test_concurrent_nft_metadata_lookups_fetch_once(wallet, fetch):
+    results = await asyncio.gather(*(wallet.get_nft_metadata(MINT) for _ in range(10)))
+
+    assert fetch.call_count == 1
+    assert all(result is results[0] for result in results)
+
+
+async def test_nft_metadata_cached_per_standard(wallet, fetch):
+    await wallet.get_nft_metadata(MINT)
+    await wallet.get_nft_metadata(MINT, NFTConfig(standard=NFTStandard.CANDY_MACHINE))
+
+    assert fetch.call_count == 2
+
+
+async def test_nft_metadata_cache_evicts_least_recently_used(wallet, fetch):
+    with patch("pipeiq_framework.phantom_client.phantom_wallet.NFT_METADATA_CACHE_SIZE", 2):
+        await wallet.get_nft_metadata("mint-1")
+        await wallet.get_nft_metadata("mint-2")
+        await wallet.get_nft_metadata("mint-1")
+        await wallet.get_nft_metadata("mint-3")
+        await wallet.get_nft_metadata("mint-1")
+        assert fetch.call_count == 3
+
+        await wallet.get_nft_metadata("mint-2")
+        assert fetch.call_count == 4
@@ -0,0 +1,125 @@
+"""
+Shared fixtures for the Prime Intellect client tests.
+"""
+
+import json
+import re
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from pipeiq_framework.prime_intellect_client import PrimeIntellectClient
+
+# A script against the live API, run with ``python``; keep it out of the unit tests
+collect_ignore = ["test_real_implementation.py"]
+
+
+class MockResponse:
+    """Minimal stand-in for the response context manager aiohttp returns."""
+
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return None
+
+    async def read(self):
+        return self._body
+
+
+class MockTransport:
+    """
+    Serve ``ClientSession.request`` calls from responses registered by URL.
+
+    A route's URL is either an exact string or a compiled pattern matched
+    against the start of the request URL. Routes are tried in registration
+    order and each is served once unless registered with ``repeat=True``.
+    Every request made is recorded in ``requests``.
+    """
+
+    def __init__(self):
+        self._routes = []
+        self.requests = []
+
+    def reset(self):
+        """Forget all registered routes and recorded requests."""
+        self._routes.clear()
+        self.requests.clear()
+
+    def add(self, method, url, status=200, payload=None, body=None, headers=None, repeat=False):
+        """Register a response for ``method`` requests to ``url``."""
+        if body is None:
+            body = json.dumps(payload)
+        response = (status, dict(headers or {}), body.encode())
+        self._routes.append((method, url, response, repeat))
+
+    def get(self, url, **kwargs):
+        """Register a response for GET requests to ``url``."""
+        self.add("GET", url, **kwargs)
+
+    def request(self, method, url, **kwargs):
+        """Replacement for ``ClientSession.request``."""
+        self.requests.append(SimpleNamespace(method=method, url=url, kwargs=kwargs))
+        for index, (route_method, route_url, response, repeat) in enumerate(self._routes):
+            if route_method != method:
+                continue
+            if isinstance(route_url, re.Pattern):
+                matched = route_url.match(url) is not None
+            else:
+                matched = route_url == url
+            if matched:
+                if not repeat:
+                    del self._routes[index]
+                return MockResponse(*response)
+        raise AssertionError(f"No mock response registered for {method} {url}")
+
+
+@pytest.fixture(scope="module")
+def module_transport():
+    """One mock transport per test module."""
+    return MockTransport()
+
+
+@pytest.fixture
+def transport(module_transport):
+    """The module's transport, with no routes or recorded requests."""
+    module_transport.reset()
+    return module_transport
+
+
+@pytest.fixture(scope="session")
+async def shared_client():
+    """One default-configured client, and its session, for the whole run."""
+    async with PrimeIntellectClient("test-key") as client:
+        yield client
+
+
+@pytest.fixture
+def client(shared_client, transport):
+    """The shared client with an empty cache, its session wired to ``transport``."""
+    shared_client.clear_cache()
+    with patch.object(shared_client._session, "request", transport.request):
+        yield shared_client
+
+
+@pytest.fixture
+async def make_client(transport):
+    """Build clients with custom options, their sessions wired to ``transport``."""
+    clients = []
+
+    async def make(**options):
+        client = PrimeIntellectClient("test-key", **options)
+        await client._ensure_session()
+        client._session.request = transport.request
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        await client.close()
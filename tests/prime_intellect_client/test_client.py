@@ -0,0 +1,275 @@
+"""
+Unit tests for PrimeIntellectClient against a mocked HTTP transport and a local server.
+"""
+
+import asyncio
+import re
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from pipeiq_framework.prime_intellect_client import (
+    APIError,
+    AuthenticationError,
+    GPUAvailability,
+    PrimeIntellectClient,
+    Provider,
+    RateLimitError,
+    SecurityType,
+    SocketType,
+    StockStatus,
+)
+from pipeiq_framework.prime_intellect_client.client import _encode_query
+
+AVAILABILITY_URL = "https://api.primeintellect.ai/api/v1/availability/"
+# Matches the availability endpoint with any query string
+AVAILABILITY_ANY = re.compile(r"^" + re.escape(AVAILABILITY_URL))
+
+AVAILABILITY = {
+    "H100_80GB": [
+        {"cloudId": "offer-1", "gpuType": "H100_80GB", "provider": "runpod"},
+    ],
+}
+
+
+async def test_session_uses_tuned_connector():
+    async with PrimeIntellectClient(
+        "test-key",
+        max_connections=10,
+        max_connections_per_host=5,
+        dns_cache_ttl=60,
+    ) as client:
+        connector = client._session.connector
+        assert connector.limit == 10
+        assert connector.limit_per_host == 5
+        assert connector.use_dns_cache
+
+
+async def test_default_connector_is_not_capped_per_host():
+    async with PrimeIntellectClient("test-key") as client:
+        connector = client._session.connector
+        assert connector.limit == 100
+        assert connector.limit_per_host in (0, connector.limit)
+
+
+async def test_concurrent_requests_share_one_session(client, transport):
+    transport.get(AVAILABILITY_URL, payload=AVAILABILITY, repeat=True)
+    session = client._session
+    connector = session.connector
+    results = await asyncio.gather(*(client.get_availability() for _ in range(50)))
+
+    assert len(transport.requests) == 50
+    assert all(len(offers) == 1 for offers in results)
+    assert client._session is session
+    assert client._session.connector is connector
+
+
+async def test_sequential_requests_reuse_one_connection():
+    connections = []
+
+    async def availability(request):
+        connections.append(request.transport.get_extra_info("peername"))
+        return web.json_response(AVAILABILITY)
+
+    app = web.Application()
+    app.router.add_get("/api/v1/availability/", availability)
+    async with TestServer(app) as server:
+        async with PrimeIntellectClient("test-key", base_url=str(server.make_url("/"))) as client:
+            for _ in range(5):
+                offers = await client.get_availability()
+
+    assert len(offers) == 1
+    assert len(connections) == 5
+    assert len(set(connections)) == 1
+
+
+@pytest.mark.parametrize("cache_ttl, first, second, expected_requests", [
+    (60, {"gpu_type": "H100_80GB"}, {"gpu_type": "H100_80GB"}, 1),
+    (60, {"gpu_type": "H100_80GB"}, {"gpu_type": "A100_80GB"}, 2),
+    (0, {"gpu_type": "H100_80GB"}, {"gpu_type": "H100_80GB"}, 2),
+], ids=["hit-within-ttl", "keyed-on-params", "disabled-by-default"])
+async def test_response_cache(transport, make_client, cache_ttl, first, second, expected_requests):
+    transport.get(AVAILABILITY_ANY, payload=AVAILABILITY, repeat=True)
+    client = await make_client(cache_ttl=cache_ttl)
+    first_offers = await client.get_availability(**first)
+    second_offers = await client.get_availability(**second)
+
+    assert len(transport.requests) == expected_requests
+    assert first_offers == second_offers
+
+
+async def test_expired_cache_entry_is_refetched(transport, make_client):
+    transport.get(AVAILABILITY_URL, payload=AVAILABILITY, repeat=True)
+    client = await make_client(cache_ttl=60)
+    await client.get_availability()
+    with patch("pipeiq_framework.prime_intellect_client.client.time.monotonic", return_value=float("inf")):
+        await client.get_availability()
+
+    assert len(transport.requests) == 2
+
+
+async def test_cache_evicts_least_recently_used(transport, make_client):
+    transport.get(AVAILABILITY_ANY, payload=AVAILABILITY, repeat=True)
+    client = await make_client(cache_ttl=60, cache_maxsize=2)
+    await client.get_availability(gpu_count=1)
+    await client.get_availability(gpu_count=2)
+    await client.get_availability(gpu_count=1)
+    await client.get_availability(gpu_count=4)
+    await client.get_availability(gpu_count=1)
+    assert len(transport.requests) == 3
+
+    await client.get_availability(gpu_count=2)
+    assert len(transport.requests) == 4
+
+
+async def test_cache_hit_returns_parsed_offers_without_reparsing(transport, make_client):
+    transport.get(AVAILABILITY_URL, payload=AVAILABILITY, repeat=True)
+    client = await make_client(cache_ttl=60)
+    with patch.object(GPUAvailability, "from_dict", wraps=GPUAvailability.from_dict) as from_dict:
+        first = await client.get_availability()
+        second = await client.get_availability()
+
+    assert from_dict.call_count == 1
+    assert first == second
+    assert first is not second
+
+
+async def test_stale_entry_is_revalidated_with_etag(transport, make_client):
+    transport.get(AVAILABILITY_URL, payload=AVAILABILITY, headers={
+        "ETag": '"v1"',
+        "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT",
+    })
+    transport.get(AVAILABILITY_URL, status=304)
+    client = await make_client(cache_ttl=60)
+    first = await client.get_availability()
+    with patch("pipeiq_framework.prime_intellect_client.client.time.monotonic", return_value=float("inf")):
+        second = await client.get_availability()
+
+    assert transport.requests[-1].kwargs["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+    assert first == second
+
+
+async def test_changed_resource_replaces_cached_body(transport, make_client):
+    updated = {"A100_80GB": [{"cloudId": "offer-2", "gpuType": "A100_80GB"}]}
+    transport.get(AVAILABILITY_URL, payload=AVAILABILITY, headers={"ETag": '"v1"'})
+    transport.get(AVAILABILITY_URL, payload=updated, headers={"ETag": '"v2"'})
+    transport.get(AVAILABILITY_URL, status=304)
+    client = await make_client(cache_ttl=60)
+    await client.get_availability()
+    with patch("pipeiq_framework.prime_intellect_client.client.time.monotonic", return_value=float("inf")):
+        offers = await client.get_availability()
+        cached = await client.get_availability()
+
+    assert transport.requests[-1].kwargs["headers"] == {"If-None-Match": '"v2"'}
+    assert [offer.cloud_id for offer in offers] == ["offer-2"]
+    assert [offer.cloud_id for offer in cached] == ["offer-2"]
+
+
+async def test_validators_are_ignored_when_caching_is_off(client, transport):
+    transport.get(AVAILABILITY_URL, payload=AVAILABILITY, headers={"ETag": '"v1"'}, repeat=True)
+    first = await client.get_availability()
+    second = await client.get_availability()
+
+    assert [request.kwargs["headers"] for request in transport.requests] == [None, None]
+    assert first[0] is not second[0]
+
+
+async def test_retry_backs_off_exponentially_with_jitter(transport, make_client, backoff_sleep):
+    transport.get(AVAILABILITY_URL, status=429)
+    transport.get(AVAILABILITY_URL, status=503)
+    transport.get(AVAILABILITY_URL, payload=AVAILABILITY)
+    client = await make_client(max_retries=3, base_backoff=0.5)
+    with patch("pipeiq_framework._http.random.uniform", side_effect=lambda low, high: high):
+        offers = await client.get_availability()
+
+    assert len(transport.requests) == 3
+    assert [call.args[0] for call in backoff_sleep.await_args_list] == [0.5, 1.0]
+    assert len(offers) == 1
+
+
+async def test_retry_honors_retry_after(transport, make_client, backoff_sleep):
+    transport.get(AVAILABILITY_URL, status=429, headers={"Retry-After": "7"})
+    transport.get(AVAILABILITY_URL, payload=AVAILABILITY)
+    client = await make_client(max_retries=1)
+    await client.get_availability()
+
+    backoff_sleep.assert_awaited_once_with(7.0)
+
+
+@pytest.mark.parametrize("status, error, attempts", [
+    (429, RateLimitError, 3),
+    (503, APIError, 3),
+    (401, AuthenticationError, 1),
+    (404, APIError, 1),
+])
+async def test_error_statuses_retry_only_when_transient(transport, make_client, backoff_sleep, status, error, attempts):
+    transport.get(AVAILABILITY_URL, status=status, repeat=True)
+    client = await make_client(max_retries=2)
+    with pytest.raises(error):
+        await client.get_availability()
+
+    assert len(transport.requests) == attempts
+
+
+async def test_invalid_json_raises_api_error(client, transport):
+    transport.get(AVAILABILITY_URL, body="<html>not json</html>")
+    with pytest.raises(APIError, match="Invalid JSON response"):
+        await client.get_availability()
+
+
+async def test_query_params_drop_none_and_render_enum_values(client, transport):
+    transport.get(AVAILABILITY_ANY, payload=AVAILABILITY)
+    await client.get_availability(
+        regions=["united_states", None, "canada"],
+        socket=SocketType.PCIE,
+        security=SecurityType.SECURE_CLOUD,
+    )
+
+    request, = transport.requests
+    assert request.url == (
+        AVAILABILITY_URL
+        + "?regions=united_states&regions=canada&socket=PCIe&security=secure_cloud"
+    )
+
+
+async def test_repeated_filters_reuse_encoded_query(client, transport):
+    transport.get(AVAILABILITY_ANY, payload=AVAILABILITY, repeat=True)
+    await client.get_availability(gpu_type="H200_141GB", regions=["eu_west"])
+    hits = _encode_query.cache_info().hits
+    await client.get_availability(gpu_type="H200_141GB", regions=["eu_west"])
+
+    assert _encode_query.cache_info().hits == hits + 1
+    first, second = transport.requests
+    assert first.url == second.url
+
+
+async def test_query_cache_distinguishes_equal_values_that_render_differently(client, transport):
+    transport.get(AVAILABILITY_ANY, payload=AVAILABILITY, repeat=True)
+    for gpu_count in (1, 1.0, True):
+        await client.get_availability(gpu_count=gpu_count)
+
+    assert [request.url.partition("?")[2] for request in transport.requests] == [
+        "gpu_count=1", "gpu_count=1.0", "gpu_count=True",
+    ]
+
+
+async def test_offer_enums_parse_known_and_drop_unknown_values(client, transport):
+    transport.get(AVAILABILITY_URL, payload={
+        "H100_80GB": [
+            {"cloudId": "offer-1", "provider": "runpod", "socket": "SXM5", "stockStatus": "Low"},
+            {"cloudId": "offer-2", "provider": "new_provider", "socket": "OAM", "security": None},
+        ],
+    })
+    known, unknown = await client.get_availability()
+
+    assert known.provider is Provider.RUNPOD
+    assert known.socket is SocketType.SXM5
+    assert known.stock_status is StockStatus.LOW
+    assert unknown.provider is None
+    assert unknown.socket is None
+    assert unknown.security is None
@@ -9,8 +9,6 @@ without mocking the _make_request method.
 import asyncio
 import os
 import sys
-import time
-from typing import Optional
 
 # Add the pipeiq_framework to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', 'pipeiq_framework'))
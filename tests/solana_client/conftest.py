@@ -0,0 +1,51 @@
+"""
+Shared fixtures for the Solana wallet tests.
+"""
+
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from solana.rpc.async_api import AsyncClient
+
+from pipeiq_framework.solana_client.solana_wallet import SolanaWallet
+
+# Canned RPC responses, keyed by the AsyncClient method they stand in for
+RPC_FIXTURES = MappingProxyType({
+    "get_balance": SimpleNamespace(value=1_230_000_000),
+    "get_account_info": SimpleNamespace(value=None),
+})
+
+
+def _rpc_method(response):
+    """Build a stand-in AsyncClient method that always returns ``response``."""
+    async def method(self, *args, **kwargs):
+        return response
+    return method
+
+
+@pytest.fixture(autouse=True, scope="module")
+def rpc_transport():
+    """Serve wallet RPC calls from canned responses instead of devnet."""
+    methods = {
+        name: _rpc_method(response)
+        for name, response in RPC_FIXTURES.items()
+    }
+    with patch.multiple(AsyncClient, **methods):
+        yield methods
+
+
+@pytest.fixture(scope="session")
+async def wallet():
+    """One generated devnet wallet shared by tests that only read from it."""
+    wallet = SolanaWallet(network="devnet")
+    yield wallet
+    await wallet.close()
+
+
+@pytest.fixture
+async def fresh_wallet():
+    """A wallet of the test's own, for tests that close or otherwise consume it."""
+    wallet = SolanaWallet(network="devnet")
+    yield wallet
+    await wallet.close()
@@ -0,0 +1,42 @@
+"""
+Unit tests for the HTTP helpers shared by the clients.
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+
+import pytest
+
+from pipeiq_framework._http import backoff_delay, parse_retry_after
+
+
+@pytest.mark.parametrize("value, seconds", [
+    ("7", 7.0),
+    ("-3", 0.0),
+    ("Wed, 01 Jan 2020 00:00:00 GMT", 0.0),
+    ("soon", None),
+    ("inf", None),
+    ("nan", None),
+    (None, None),
+])
+def test_parse_retry_after(value, seconds):
+    assert parse_retry_after(value) == seconds
+
+
+def test_parse_retry_after_http_date():
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+
+    assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == pytest.approx(60, abs=2)
+
+
+@pytest.mark.parametrize("attempt, retry_after, delay", [
+    (0, None, 0.5),
+    (1, None, 1.0),
+    (10, None, 30.0),
+    (0, 7.0, 7.0),
+    (0, 86400.0, 30.0),
+])
+def test_backoff_delay_is_capped_at_max_backoff(attempt, retry_after, delay):
+    with patch("pipeiq_framework._http.random.uniform", side_effect=lambda low, high: high):
+        assert backoff_delay(attempt, 0.5, 30.0, retry_after) == delay
@@ -0,0 +1,181 @@
+"""
+Unit tests for WorldcoinClient against a mocked HTTP transport.
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from pipeiq_framework.worldcoin_client.worldcoin import (
+    WorldcoinClient,
+    WorldcoinJWKSError,
+    WorldcoinVerifyError,
+)
+
+JWKS = {"keys": [{"kty": "RSA", "kid": "key-1", "n": "abc", "e": "AQAB"}]}
+
+
+def _client(handler, **options):
+    """Build a WorldcoinClient whose requests are answered by ``handler``."""
+    return WorldcoinClient("app_test", transport=httpx.MockTransport(handler), **options)
+
+
+def _recording(response):
+    """A handler answering every request with ``response``; the requests are recorded on it."""
+    def handler(request):
+        handler.requests.append(request)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    handler.requests = []
+    return handler
+
+
+def _responses(*responses):
+    """Like _recording, but serving ``responses`` in order."""
+    pending = list(responses)
+
+    def handler(request):
+        handler.requests.append(request)
+        return pending.pop(0)
+
+    handler.requests = []
+    return handler
+
+
+async def test_client_uses_tuned_connection_pool():
+    with patch("pipeiq_framework.worldcoin_client.worldcoin.httpx.AsyncClient") as client_cls:
+        WorldcoinClient(
+            "app_test",
+            max_connections=10,
+            max_keepalive_connections=5,
+            keepalive_expiry=30.0,
+        )
+
+    assert client_cls.call_count == 1
+    assert client_cls.call_args.kwargs["limits"] == httpx.Limits(
+        max_connections=10,
+        max_keepalive_connections=5,
+        keepalive_expiry=30.0,
+    )
+
+
+async def test_close_releases_http_client():
+    async with WorldcoinClient("app_test") as client:
+        http_client = client._client
+    assert http_client.is_closed
+
+
+async def test_concurrent_jwks_calls_share_one_request():
+    handler = _recording(httpx.Response(200, json=JWKS))
+    async with _client(handler) as client:
+        results = await asyncio.gather(*(client.get_jwks() for _ in range(10)))
+        assert results == [JWKS] * 10
+        assert len(handler.requests) == 1
+
+        await client.get_jwks()
+        assert len(handler.requests) == 2  # Not cached by default
+
+
+async def test_jwks_cached_until_ttl_expires():
+    handler = _recording(httpx.Response(200, json=JWKS))
+    async with _client(handler, jwks_cache_ttl=60) as client:
+        await client.get_jwks()
+        await client.get_jwks()
+        assert len(handler.requests) == 1
+
+        with patch("pipeiq_framework.worldcoin_client.worldcoin.time.monotonic", return_value=float("inf")):
+            await client.get_jwks()
+        assert len(handler.requests) == 2
+
+
+async def test_jwks_error_reaches_every_waiter():
+    async with _client(lambda request: httpx.Response(503, text="unavailable")) as client:
+        results = await asyncio.gather(*(client.get_jwks() for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(result, WorldcoinJWKSError) for result in results)
+
+
+@pytest.mark.parametrize("response", [
+    httpx.Response(503, text="unavailable"),
+    httpx.ConnectError("connection refused"),
+], ids=["server-error", "network-error"])
+async def test_jwks_failure_is_negatively_cached(response):
+    handler = _recording(response)
+    async with _client(handler, jwks_error_ttl=0.5) as client:
+        for _ in range(3):
+            with pytest.raises(WorldcoinJWKSError):
+                await client.get_jwks()
+        assert len(handler.requests) == 1
+
+        with patch("pipeiq_framework.worldcoin_client.worldcoin.time.monotonic", return_value=float("inf")):
+            with pytest.raises(WorldcoinJWKSError):
+                await client.get_jwks()
+        assert len(handler.requests) == 2
+
+
+async def test_jwks_client_error_is_not_negatively_cached():
+    handler = _recording(httpx.Response(404, text="not found"))
+    async with _client(handler, jwks_error_ttl=0.5) as client:
+        for _ in range(2):
+            with pytest.raises(WorldcoinJWKSError, match="HTTP 404"):
+                await client.get_jwks()
+
+    assert len(handler.requests) == 2
+
+
+async def test_verify_proof_posts_payload_and_parses_body():
+    handler = _recording(httpx.Response(200, json={"success": True, "nullifier_hash": "0xabc"}))
+    async with _client(handler) as client:
+        result = await client.verify_proof("0xabc", "0xroot", "0xproof", "login")
+
+    assert result == {"success": True, "nullifier_hash": "0xabc"}
+    request, = handler.requests
+    assert request.url.path == "/api/v2/verify/app_test"
+    assert json.loads(request.content)["verification_level"] == "orb"
+    assert request.headers["User-Agent"] == "worldcoin-client/0.1"
+
+
+async def test_verify_proof_error_status_raises():
+    async with _client(lambda request: httpx.Response(400, text="invalid_proof")) as client:
+        with pytest.raises(WorldcoinVerifyError, match="HTTP 400: invalid_proof"):
+            await client.verify_proof("0xabc", "0xroot", "0xproof", "login")
+
+
+async def test_transient_statuses_are_retried_after_backoff(backoff_sleep):
+    handler = _responses(
+        httpx.Response(429, headers={"Retry-After": "7"}),
+        httpx.Response(503),
+        httpx.Response(200, json={"action": "login"}),
+    )
+    async with _client(handler, max_retries=2) as client:
+        metadata = await client.get_action_metadata("login")
+
+    assert metadata == {"action": "login"}
+    assert len(handler.requests) == 3
+    assert backoff_sleep.await_count == 2
+    assert backoff_sleep.await_args_list[0].args[0] == 7.0
+
+
+@pytest.mark.parametrize("status, attempts", [(429, 3), (503, 1), (400, 1)])
+async def test_verify_proof_retries_only_rate_limiting(backoff_sleep, status, attempts):
+    handler = _responses(*(httpx.Response(status) for _ in range(3)))
+    async with _client(handler, max_retries=2) as client:
+        with pytest.raises(WorldcoinVerifyError, match=f"HTTP {status}"):
+            await client.verify_proof("0xabc", "0xroot", "0xproof", "login")
+
+    assert len(handler.requests) == attempts
+
+
+async def test_no_retries_by_default(backoff_sleep):
+    handler = _responses(httpx.Response(503, text="unavailable"))
+    async with _client(handler) as client:
+        with pytest.raises(WorldcoinJWKSError, match="HTTP 503"):
+            await client.get_jwks()
+
+    assert len(handler.requests) == 1
+    backoff_sleep.assert_not_awaited()